@@ -1,5 +1,6 @@
 import os
 import pathlib
+import sys
 
 from setuptools import setup, Extension, find_packages
 from setuptools.command.build_ext import build_ext as build_ext_orig
@@ -26,24 +27,28 @@ class build_ext(build_ext_orig):
         build_temp.mkdir(parents=True, exist_ok=True)
         extdir = pathlib.Path(self.get_ext_fullpath(ext.name))
 
-        config = 'Release ' + '--j4'
+        config = 'Release'
+
+        if sys.platform == "win32":
+            cxx_flags = '/O2 /arch:AVX2 /fp:fast /DNDEBUG'
+        else:
+            cxx_flags = '-O3 -march=native -ffast-math -funroll-loops -DNDEBUG'
+
         cmake_args = [
             '-DCMAKE_LIBRARY_OUTPUT_DIRECTORY=' + str(extdir.parent.absolute()),
-            '-DCMAKE_BUILD_TYPE=' + config
+            '-DCMAKE_BUILD_TYPE=' + config,
+            '-DCMAKE_CXX_FLAGS_RELEASE=' + cxx_flags,
+            '-DCMAKE_CUDA_FLAGS_RELEASE=-O3 --use_fast_math'
         ]
 
         build_args = [
-            '--config', config
+            '--config', config,
+            '--parallel', str(os.cpu_count() or 4)
         ]
 
-        os.chdir(str(build_temp))
-        self.spawn(['cmake', str(cwd)] + cmake_args)
+        self.spawn(['cmake', '-S', str(cwd), '-B', str(build_temp)] + cmake_args)
         if not self.dry_run:
-            if os.name != "nt":
-                self.spawn(['cmake', '--build', '.'] + build_args)
-            else:
-                self.spawn(['cmake', '--build', '.'])
-        os.chdir(str(cwd))
+            self.spawn(['cmake', '--build', str(build_temp)] + build_args)
 
 required = [
     "numpy",
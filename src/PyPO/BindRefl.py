@@ -10,8 +10,11 @@ import os
 import sys
 import pathlib
 
+from collections import OrderedDict
+
 import PyPO.BindUtils as BUtils
 import PyPO.Structs as PStructs
+import PyPO.PyPOTypes as PTypes
 
 def loadRefllib():
     """!
@@ -21,17 +24,79 @@ def loadRefllib():
     """
 
     path_cur = pathlib.Path(__file__).parent.resolve()
-    try:
+
+    if sys.platform == "win32":
         lib = ctypes.CDLL(os.path.join(path_cur, "pyporefl.dll"))
-    except:
-        try:
-            lib = ctypes.CDLL(os.path.join(path_cur, "libpyporefl.so"))
-        except:
-            lib = ctypes.CDLL(os.path.join(path_cur, "libpyporefl.dylib"))
+
+    elif sys.platform == "darwin":
+        lib = ctypes.CDLL(os.path.join(path_cur, "libpyporefl.dylib"))
+
+    else:
+        lib = ctypes.CDLL(os.path.join(path_cur, "libpyporefl.so"))
+
+    lib.generateGrid.argtypes = [PStructs.reflparams, ctypes.POINTER(PStructs.reflcontainer),
+                                ctypes.c_bool, ctypes.c_bool]
+    lib.generateGrid.restype = None
 
     return lib
 
-def generateGrid(reflparams_py, transform=True, spheric=True): 
+# The library is loaded on the first call to generateGrid and cached here, so that
+# importing this module stays cheap and repeated grid generations do not re-open
+# the shared library.
+_LIB = None
+
+# Bounded cache of generated grids, keyed on the generating parameters. Repeated
+# generations of an unchanged reflector, common in optimization and efficiency
+# loops, then skip the C++ kernel entirely.
+_GRID_CACHE = OrderedDict()
+_GRID_CACHE_MAXSIZE = 16
+
+def _gridCacheKey(reflparams_py, transform, spheric):
+    """!
+    Build a hashable cache key from the parameters that determine a reflector grid.
+
+    @param reflparams_py A reflDict dictionary.
+    @param transform Whether the transformation matrix is applied.
+    @param spheric Convert Az-El co-ordinates to spherical (far-field only).
+
+    @returns key Cache key, or None if the grid cannot be cached.
+    """
+
+    # Reflectors with surface errors are generated from a random process, so never cache these.
+    if reflparams_py["rms"]:
+        return None
+
+    if reflparams_py["gmode"] == 0:
+        lims = (reflparams_py["lims_x"], reflparams_py["lims_y"])
+
+    elif reflparams_py["gmode"] == 1:
+        lims = (reflparams_py["lims_u"], reflparams_py["lims_v"])
+
+    elif reflparams_py["gmode"] == 2:
+        lims = (reflparams_py["lims_Az"], reflparams_py["lims_El"])
+
+    arrs = (reflparams_py["coeffs"], *lims, reflparams_py["gcenter"], reflparams_py["gridsize"],
+            reflparams_py["transf"] if transform else None)
+
+    return (int(reflparams_py["type"]), int(reflparams_py["gmode"]), bool(reflparams_py["flip"]),
+            float(reflparams_py["ecc_uv"]), float(reflparams_py["rot_uv"]),
+            bool(transform), bool(spheric),
+            tuple(None if arr is None else np.asarray(arr, dtype=np.float64).tobytes() for arr in arrs))
+
+def _copyGrids(grids):
+    """!
+    Deep copy a reflGrids object, so that mutations by callers cannot reach cached grids.
+
+    @param grids A reflGrids object.
+
+    @returns out A reflGrids object containing copies of the grids.
+    """
+
+    return PTypes.reflGrids(grids.x.copy(), grids.y.copy(), grids.z.copy(),
+                            grids.nx.copy(), grids.ny.copy(), grids.nz.copy(),
+                            grids.area.copy())
+
+def generateGrid(reflparams_py, transform=True, spheric=True):
     """!
     Double precision function for generating reflector grids.
     This is the function called by the CPU PyPO bindings.
@@ -44,25 +109,34 @@ def generateGrid(reflparams_py, transform=True, spheric=True):
     @returns grids A reflGrids object. 
     """
 
-    lib = loadRefllib()
+    global _LIB
+    if _LIB is None:
+        _LIB = loadRefllib()
+
+    key = _gridCacheKey(reflparams_py, transform, spheric)
+
+    if key is not None and key in _GRID_CACHE:
+        _GRID_CACHE.move_to_end(key)
+        return _copyGrids(_GRID_CACHE[key])
 
     size = reflparams_py["gridsize"][0] * reflparams_py["gridsize"][1]
 
     inp = PStructs.reflparams()
     res = PStructs.reflcontainer()
-    
+
 
     BUtils.allfill_reflparams(inp, reflparams_py, ctypes.c_double)
     BUtils.allocate_reflcontainer(res, size, ctypes.c_double)
 
-    lib.generateGrid.argtypes = [PStructs.reflparams, ctypes.POINTER(PStructs.reflcontainer),
-                                ctypes.c_bool, ctypes.c_bool]
-    lib.generateGrid.restype = None
-
-    lib.generateGrid(inp, ctypes.byref(res), transform, spheric)
+    _LIB.generateGrid(inp, ctypes.byref(res), transform, spheric)
     
 
     grids = BUtils.creflToObj(res, reflparams_py["gridsize"], np.float64)
-    
+
+    if key is not None:
+        _GRID_CACHE[key] = _copyGrids(grids)
+
+        while len(_GRID_CACHE) > _GRID_CACHE_MAXSIZE:
+            _GRID_CACHE.popitem(last=False)
 
     return grids
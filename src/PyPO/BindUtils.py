@@ -287,42 +287,46 @@ def allfill_reflparams(inp, reflparams_py, ct_t):
     @see reflDict
     """
 
-    inp.coeffs = (ct_t * 3)()
+    np_t = np.float64 if ct_t == ctypes.c_double else np.float32
+
     inp.type = ctypes.c_int(reflparams_py["type"])
     inp.ecc_uv = ct_t(reflparams_py["ecc_uv"])
     inp.rot_uv = ct_t(reflparams_py["rot_uv"])
 
-    for i in range(3):
-        inp.coeffs[i] = ct_t(reflparams_py["coeffs"][i])
+    if reflparams_py["gmode"] == 0:
+        lxu, lyv = reflparams_py["lims_x"], reflparams_py["lims_y"]
+
+    elif reflparams_py["gmode"] == 1:
+        lxu, lyv = reflparams_py["lims_u"], reflparams_py["lims_v"]
 
-    inp.lxu = (ct_t * 2)()
-    inp.lyv = (ct_t * 2)()
-    inp.gcenter = (ct_t * 2)()
-    inp.n_cells = (ctypes.c_int * 2)()
+    elif reflparams_py["gmode"] == 2:
+        lxu, lyv = reflparams_py["lims_Az"], reflparams_py["lims_El"]
 
-    for i in range(2):
-        if reflparams_py["gmode"] == 0:
-            inp.lxu[i] = ct_t(reflparams_py["lims_x"][i])
-            inp.lyv[i] = ct_t(reflparams_py["lims_y"][i])
+    # Pack all floating point fields into a single contiguous buffer filled by slice
+    # assignment and point the struct fields at its slices; n_cells gets its own small
+    # integer buffer. The buffers are kept on the struct: the pointer fields themselves
+    # do not hold a Python reference to them.
+    buf = np.empty(25, dtype=np_t)
+    buf[0:3] = reflparams_py["coeffs"]
+    buf[3:5] = lxu
+    buf[5:7] = lyv
+    buf[7:9] = reflparams_py["gcenter"]
+    buf[9:25] = np.asarray(reflparams_py["transf"]).ravel()
 
-        elif reflparams_py["gmode"] == 1:
-            inp.lxu[i] = ct_t(reflparams_py["lims_u"][i])
-            inp.lyv[i] = ct_t(reflparams_py["lims_v"][i])
+    n_cells = np.ascontiguousarray(reflparams_py["gridsize"], dtype=np.int32)
 
-        elif reflparams_py["gmode"] == 2:
-            inp.lxu[i] = ct_t(reflparams_py["lims_Az"][i])
-            inp.lyv[i] = ct_t(reflparams_py["lims_El"][i])
+    inp._buffers = (buf, n_cells)
 
-        inp.gcenter[i] = ct_t(reflparams_py["gcenter"][i])
-        inp.n_cells[i] = ctypes.c_int(reflparams_py["gridsize"][i])
+    inp.coeffs = buf[0:3].ctypes.data_as(ctypes.POINTER(ct_t))
+    inp.lxu = buf[3:5].ctypes.data_as(ctypes.POINTER(ct_t))
+    inp.lyv = buf[5:7].ctypes.data_as(ctypes.POINTER(ct_t))
+    inp.gcenter = buf[7:9].ctypes.data_as(ctypes.POINTER(ct_t))
+    inp.transf = buf[9:25].ctypes.data_as(ctypes.POINTER(ct_t))
+    inp.n_cells = n_cells.ctypes.data_as(ctypes.POINTER(ctypes.c_int))
 
     inp.flip = ctypes.c_bool(reflparams_py["flip"])
     inp.gmode = ctypes.c_int(reflparams_py["gmode"])
 
-    inp.transf = (ct_t * 16)()
-    for i in range(16):
-        inp.transf[i] = ct_t(reflparams_py["transf"].ravel()[i])
-
     inp.rms = ct_t(reflparams_py["rms"])
     inp.rms_seed = ctypes.c_uint(reflparams_py["rms_seed"])
 
@@ -341,15 +345,17 @@ def allocate_reflcontainer(res, size, ct_t):
 
     res.size = size
 
-    res.x = (ct_t * size)()
-    res.y = (ct_t * size)()
-    res.z = (ct_t * size)()
-
-    res.nx = (ct_t * size)()
-    res.ny = (ct_t * size)()
-    res.nz = (ct_t * size)()
+    # Allocate a single contiguous block through numpy and point the struct fields at
+    # its rows, so the C/C++ side fills memory that is already live on the Python side
+    # and the seven buffers land in one sequential region. The block is kept on the
+    # struct: the pointer fields themselves do not hold a Python reference, and
+    # creflToObj returns views into the block without copying.
+    np_t = np.float64 if ct_t == ctypes.c_double else np.float32
+    res._block = np.zeros((7, size), dtype=np_t)
+    res._arrays = tuple(res._block)
 
-    res.area = (ct_t * size)()
+    res.x, res.y, res.z, res.nx, res.ny, res.nz, res.area = \
+        (arr.ctypes.data_as(ctypes.POINTER(ct_t)) for arr in res._arrays)
 
 def allfill_reflcontainer(res, reflc_py, ct_t):
     """!
@@ -582,18 +588,13 @@ def creflToObj(res, shape, np_t):
 
     @see reflcontainer
     @see reflcontainerf
-    @see reflGrids 
+    @see reflGrids
     """
 
-    x = np.ctypeslib.as_array(res.x, shape=shape).astype(np_t)
-    y = np.ctypeslib.as_array(res.y, shape=shape).astype(np_t)
-    z = np.ctypeslib.as_array(res.z, shape=shape).astype(np_t)
-
-    nx = np.ctypeslib.as_array(res.nx, shape=shape).astype(np_t)
-    ny = np.ctypeslib.as_array(res.ny, shape=shape).astype(np_t)
-    nz = np.ctypeslib.as_array(res.nz, shape=shape).astype(np_t)
+    # The output buffers are numpy arrays allocated in allocate_reflcontainer and
+    # filled in place by the C/C++ side, so only reshaped views are made here.
+    x, y, z, nx, ny, nz, area = (arr.reshape(shape).astype(np_t, copy=False) for arr in res._arrays)
 
-    area = np.ctypeslib.as_array(res.area, shape=shape).astype(np_t)
     out = PTypes.reflGrids(x, y, z, nx, ny, nz, area)
     return out
 
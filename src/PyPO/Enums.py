@@ -3,24 +3,19 @@
 File containing enum types for PyPO methods.
 """
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
 
 import numpy as np
 
-class CustomEnumScalar(Enum):
+class CustomEnumScalar(IntEnum):
     def __str__(self):
         return self.name
 
 class CustomEnumString(Enum):
     def __str__(self):
         return self.name
-    
-    def __rmul__(self, other):
-        return NotImplemented
-    
-    def __rtruediv__(self, other):
-        return NotImplemented
-    
+
+
 class Unit(float):
     """!
     A custom float with extra metadata that is useful for units.
@@ -70,7 +65,7 @@ class FieldComponents(CustomEnumScalar):
     Hx = 3
     Hy = 4
     Hz = 5
-    NONE = None
+    NONE = -1
 
 class CurrentComponents(CustomEnumScalar):
     """!
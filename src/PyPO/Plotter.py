@@ -243,13 +243,13 @@ def plotBeam2D(reflGrid, field, gmode=GridModes.xy,
             else:
                 phase = np.angle(field*phase_factor)
             
-            ampfig = ax[0].pcolormesh(grid_x1 / units.value, grid_x2 / units.value, field_pl,
+            ampfig = ax[0].pcolormesh(grid_x1/units, grid_x2/units, field_pl,
                                     vmin=vmin, vmax=vmax, **kwargs)
-            phasefig = ax[1].pcolormesh(grid_x1 / units.value, grid_x2 / units.value, phase, **kwargs)
+            phasefig = ax[1].pcolormesh(grid_x1/units, grid_x2/units, phase, **kwargs)
 
             if contour is not None:
-                cont0 = ax[0].contour(grid_x1 / units.value, grid_x2 / units.value, contour, levels, cmap=cm.binary, linewidths=0.5)
-                cont1 = ax[1].contour(grid_x1 / units.value, grid_x2 / units.value, np.angle(contour), levels, cmap=cm.binary, linewidths=0.5)
+                cont0 = ax[0].contour(grid_x1/units, grid_x2/units, contour, levels, cmap=cm.binary, linewidths=0.5)
+                cont1 = ax[1].contour(grid_x1/units, grid_x2/units, np.angle(contour), levels, cmap=cm.binary, linewidths=0.5)
 
                 ax[0].clabel(cont0)
                 ax[1].clabel(cont1)
@@ -377,7 +377,7 @@ def plotBeam2D(reflGrid, field, gmode=GridModes.xy,
                                     vmin=vmin, vmax=vmax, **kwargs)
             
             if contour is not None:
-                cont = ax.contour(units.rdiv(grid_x1), units.rdiv(grid_x2), contour_pl, levels, cmap=cm.binary, linewidths=0.5)
+                cont = ax.contour(grid_x1/units, grid_x2/units, contour_pl, levels, cmap=cm.binary, linewidths=0.5)
                 ax.clabel(cont)
         else: # scale == Scales.dB:
             if titleA == "Power":
@@ -402,7 +402,7 @@ def plotBeam2D(reflGrid, field, gmode=GridModes.xy,
                                     vmin=vmin, vmax=vmax, **kwargs)
             
             if contour is not None:
-                cont = ax.contour(units.rdiv(grid_x1), units.rdiv(grid_x2), contour_dB, levels, cmap=cm.binary, linewidths=0.5)
+                cont = ax.contour(grid_x1/units, grid_x2/units, contour_dB, levels, cmap=cm.binary, linewidths=0.5)
                 ax.clabel(cont)
 
         ax.set_ylabel(r"${}$ ({})".format(comps[1], units.name))
@@ -5,35 +5,80 @@ Definitions of PyPO data structures.
 
 import numpy as np
 
+def _slot_items(obj):
+    """!
+    Collect the public attributes of a slotted PyPO object as a dictionary.
+
+    @param obj A PyPO data structure using __slots__.
+
+    @returns items Dictionary of attribute names and values, for saving to file.
+    """
+
+    items = {}
+    for cls in type(obj).__mro__:
+        for key in getattr(cls, "__slots__", ()):
+            if not key.startswith("_") and hasattr(obj, key):
+                items[key] = getattr(obj, key)
+    return items
+
+def _restoreState(obj, state):
+    """!
+    Restore a pickled PyPO object onto a slotted instance.
+
+    Handles both the slotted pickle state and the plain attribute dictionaries
+    found in system files saved before __slots__ were introduced.
+
+    @param obj A PyPO data structure using __slots__.
+    @param state State from pickle, either a dictionary or a (dict, dict) tuple.
+    """
+
+    if isinstance(state, tuple):
+        for part in state:
+            if part:
+                for key, val in part.items():
+                    setattr(obj, key, val)
+
+    else:
+        for key, val in state.items():
+            setattr(obj, key, val)
+
 class resContainer(object):
     """!
     Base class for EH fields and JM currents.
 
     @ingroup public_api_types
     """
-    
+
+    __slots__ = ("type", "memlist", "shape", "size", "surf", "k", "_comps",
+                 "Ex", "Ey", "Ez", "Hx", "Hy", "Hz",
+                 "Jx", "Jy", "Jz", "Mx", "My", "Mz")
+
+    # Component labels per container type, built once at class level.
+    _LABELS = {
+            "EH" : ("Ex", "Ey", "Ez", "Hx", "Hy", "Hz"),
+            "JM" : ("Jx", "Jy", "Jz", "Mx", "My", "Mz"),
+            }
+
     def __init__(self, *args, restype=None):
         """!
         Constructor. Takes EH/JM components and assigns them to member variables.
-        Also creates a member variable, in which the EH/JM labels are stored for the getter/setter functions. 
-        
+        Also creates a member variable, in which the EH/JM labels are stored for the getter/setter functions.
+
         @param args Sequence of EH/JM components.
         @param restype Whether object is a field ("EH") or a current ("JM"). Default is "EH".
         """
 
         self.type = "EH" if restype is None else restype
-        self.memlist = []
+        self.memlist = self._LABELS[self.type]
         self.shape = args[0].shape
         self.size = self.shape[0] * self.shape[1]
-        
-        n = 0
-        ax = ["x", "y", "z"]
-        
-        for i, arg in enumerate(args):
-            if not i % 3 and i != 0:
-                n += 1
-            self.memlist.append(f"{self.type[n]}{ax[i - 3*n]}")
-            setattr(self, self.memlist[i], arg)
+
+        # Components are also stored in a list, so that indexing does not go
+        # through a getattr on the component name.
+        self._comps = list(args)
+
+        for label, arg in zip(self.memlist, args):
+            setattr(self, label, arg)
     
     def setMeta(self, surf, k):
         """!
@@ -54,8 +99,8 @@ class resContainer(object):
         """
 
         try:
-            return getattr(self, self.memlist[idx])
-        
+            return self._comps[idx]
+
         except:
             raise IndexError(f'Index out of range: {idx}')
 
@@ -68,11 +113,26 @@ class resContainer(object):
         """
 
         try:
+            self._comps[idx] = item
             setattr(self, self.memlist[idx], item)
-        
+
         except:
             raise IndexError(f'Index out of range: {idx}')
 
+    def __setstate__(self, state):
+        """!
+        Restore EH/JM components and metadata from pickle.
+        System files saved before this class used __slots__ carry no component
+        list, so it is rebuilt from the restored named attributes.
+
+        @param state State from pickle.
+        """
+
+        _restoreState(self, state)
+
+        if not hasattr(self, "_comps"):
+            self._comps = [getattr(self, label) for label in self.memlist]
+
     def T(self):
         """!
         Transpose of own fields/currents.
@@ -85,10 +145,15 @@ class resContainer(object):
     def H(self):
         """!
         Complex conjugate (Hermitian) transpose of own fields/currents.
+        The conjugate is calculated over all components at once, in a single allocation.
         """
 
+        arr = np.stack(self._comps)
+        np.conjugate(arr, out=arr)
+        arr = arr.swapaxes(1, 2)
+
         for i in range(6):
-            self[i] = self[i].conj().T
+            self[i] = arr[i]
         return self
 
 class currents(resContainer):
@@ -98,6 +163,8 @@ class currents(resContainer):
     @ingroup public_api_types
     """
 
+    __slots__ = ()
+
     def __init__(self, Jx, Jy, Jz, Mx, My, Mz):
         """!
         Constructor. Takes JM components and assigns them to member variables.
@@ -117,7 +184,7 @@ class currents(resContainer):
         Save a currents object to a numpy compressed arrays (`.npz`) file.
         
         @param filename The path and name of the file to save to."""
-        np.savez_compressed(filename, **self.__dict__)
+        np.savez_compressed(filename, **_slot_items(self))
         
 def load_currents(filename):
     """!
@@ -140,6 +207,8 @@ class fields(resContainer):
     @ingroup public_api_types
     """
 
+    __slots__ = ()
+
     def __init__(self, Ex, Ey, Ez, Hx, Hy, Hz):
         """!
         Constructor. Takes JM components and assigns them to member variables.
@@ -159,7 +228,7 @@ class fields(resContainer):
         Save a field object to a numpy compressed arrays (`.npz`) file.
         
         @param filename The path and name of the file to save to."""
-        np.savez_compressed(filename, **self.__dict__)
+        np.savez_compressed(filename, **_slot_items(self))
         
 def load_fields(filename):
     """!
@@ -182,6 +251,8 @@ class rfield(object):
     @ingroup public_api_types
     """
 
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, Prx, Pry, Prz):
         """!
         Constructor. Takes Poynting components and assigns to member variables.
@@ -194,13 +265,22 @@ class rfield(object):
         self.x = Prx
         self.y = Pry
         self.z = Prz
-        
+
+    def __setstate__(self, state):
+        """!
+        Restore attributes from pickle, including pre-__slots__ system files.
+
+        @param state State from pickle.
+        """
+
+        _restoreState(self, state)
+
     def save(self, filename):
         """!
         Save a rfield object to a numpy compressed arrays (`.npz`) file.
         
         @param filename The path and name of the file to save to."""
-        np.savez_compressed(filename, **self.__dict__)
+        np.savez_compressed(filename, **_slot_items(self))
         
 def load_rfield(filename):
     """!
@@ -220,6 +300,8 @@ class scalarfield(object):
     @ingroup public_api_types
     """
 
+    __slots__ = ("S", "surf", "k")
+
     def __init__(self, S):
         """!
         Constructor for scalar field.
@@ -229,6 +311,15 @@ class scalarfield(object):
 
         self.S = S
 
+    def __setstate__(self, state):
+        """!
+        Restore attributes from pickle, including pre-__slots__ system files.
+
+        @param state State from pickle.
+        """
+
+        _restoreState(self, state)
+
     def setMeta(self, surf, k):
         """!
         Set scalar field metadata.
@@ -245,7 +336,7 @@ class scalarfield(object):
         Save a scalarfield object to a numpy compressed arrays (`.npz`) file.
         
         @param filename The path and name of the file to save to."""
-        np.savez_compressed(filename, **self.__dict__)
+        np.savez_compressed(filename, **_slot_items(self))
         
 def load_scalarfield(filename):
     """!
@@ -267,6 +358,8 @@ class reflGrids(object):
     @ingroup public_api_types
     """
 
+    __slots__ = ("x", "y", "z", "nx", "ny", "nz", "area")
+
     def __init__(self, x, y, z, nx, ny, nz, area):
         """!
         Constructor. Takes grid points, normals and area elements and stores them.
@@ -289,13 +382,22 @@ class reflGrids(object):
         self.nz = nz
 
         self.area = area
-        
+
+    def __setstate__(self, state):
+        """!
+        Restore attributes from pickle, including pre-__slots__ system files.
+
+        @param state State from pickle.
+        """
+
+        _restoreState(self, state)
+
     def save(self, filename):
         """!
         Save a grid object to a numpy compressed arrays (`.npz`) file.
         
         @param filename The path and name of the file to save to."""
-        np.savez_compressed(filename, **self.__dict__)
+        np.savez_compressed(filename, **_slot_items(self))
         
 def load_grid(filename):
     """!
@@ -314,6 +416,8 @@ class frame(object):
     @ingroup public_api_types
     """
 
+    __slots__ = ("size", "x", "y", "z", "dx", "dy", "dz", "snapshots", "pos", "ori", "transf")
+
     def __init__(self, size, x, y, z, dx, dy, dz):
         """!
         Constructor. Takes frame points and directions and stores them.
@@ -338,6 +442,15 @@ class frame(object):
 
         self.snapshots = {}
 
+    def __setstate__(self, state):
+        """!
+        Restore attributes from pickle, including pre-__slots__ system files.
+
+        @param state State from pickle.
+        """
+
+        _restoreState(self, state)
+
     def setMeta(self, pos, ori, transf):
         """!
         Set frame metadata.
@@ -356,7 +469,7 @@ class frame(object):
         Save a frame object to a numpy compressed arrays (`.npz`) file.
         
         @param filename The path and name of the file to save to."""
-        np.savez_compressed(filename, **self.__dict__)
+        np.savez_compressed(filename, **_slot_items(self))
         
 def load_frame(filename):
     """!
@@ -5,6 +5,7 @@ Tests for checking if grids in PyPO are correct
 
 import unittest
 import ctypes
+import numpy as np
 
 from nose2.tools import params
 
@@ -31,6 +32,59 @@ class Test_SystemGrids(unittest.TestCase):
         grids = self.s.generateGrids(element["name"])
         self.assertEqual(type(grids), pypotypes.reflGrids)
 
+class Test_GridCache(unittest.TestCase):
+    def setUp(self):
+        refllibs._GRID_CACHE.clear()
+
+    def _getParaboloidDict(self, rms=0.):
+        return {"name" : "testParaboloid_cache", "type" : 0, "gmode" : 0, "flip" : False,
+                "coeffs" : np.array([1., 1., 0.]), "lims_x" : np.array([-1., 1.]),
+                "lims_y" : np.array([-1., 1.]), "gcenter" : np.array([0., 0.]),
+                "gridsize" : np.array([31, 31]), "ecc_uv" : 0., "rot_uv" : 0.,
+                "transf" : np.eye(4), "rms" : rms, "rms_seed" : 0}
+
+    def test_cacheHit(self):
+        params = self._getParaboloidDict()
+
+        grids0 = refllibs.generateGrid(params, transform=False)
+        self.assertEqual(len(refllibs._GRID_CACHE), 1)
+
+        grids1 = refllibs.generateGrid(params, transform=False)
+        for label in ("x", "y", "z", "nx", "ny", "nz", "area"):
+            self.assertTrue(np.array_equal(getattr(grids0, label), getattr(grids1, label)))
+
+    def test_cacheCopyIsolation(self):
+        params = self._getParaboloidDict()
+
+        grids0 = refllibs.generateGrid(params, transform=False)
+        x0 = grids0.x.copy()
+
+        grids1 = refllibs.generateGrid(params, transform=False)
+        grids1.x[:] = 0.
+
+        grids2 = refllibs.generateGrid(params, transform=False)
+        self.assertTrue(np.array_equal(grids2.x, x0))
+
+    def test_cacheKeyTransform(self):
+        params = self._getParaboloidDict()
+        params_t = self._getParaboloidDict()
+        params_t["transf"] = np.diag([1., 1., 1., 2.])
+
+        # Without transform the transformation matrix does not affect the key.
+        self.assertEqual(refllibs._gridCacheKey(params, False, True),
+                         refllibs._gridCacheKey(params_t, False, True))
+
+        self.assertNotEqual(refllibs._gridCacheKey(params, True, True),
+                            refllibs._gridCacheKey(params_t, True, True))
+
+    def test_noCacheRandomSurface(self):
+        params = self._getParaboloidDict(rms=1.)
+
+        self.assertIsNone(refllibs._gridCacheKey(params, False, True))
+
+        refllibs.generateGrid(params, transform=False)
+        self.assertEqual(len(refllibs._GRID_CACHE), 0)
+
 if __name__ == "__main__":
     import nose2
     nose2.main()